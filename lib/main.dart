@@ -34,11 +34,46 @@ Future<void> _requestPermission() async {
   }
 }
 
+// Name frames after the source video so frames of other videos in the
+// same directory are not picked up when collecting a run's output.
+String frameFilePrefix(String videoPath) {
+  final videoName = videoPath.split(Platform.pathSeparator).last;
+  final dot = videoName.lastIndexOf('.');
+  return dot > 0 ? videoName.substring(0, dot) : videoName;
+}
+
+// ffmpeg image2 output pattern. A literal '%' in the prefix would otherwise
+// be read as a sequence specifier, so it is escaped here only.
+String frameOutputPattern(String directoryPath, String framePrefix) {
+  return '$directoryPath/${framePrefix.replaceAll('%', '%%')}_%03d.jpg';
+}
+
+// Path of the [index]-th frame written for [frameOutputPattern].
+String frameImagePath(String directoryPath, String framePrefix, int index) {
+  return '$directoryPath/${framePrefix}_${index.toString().padLeft(3, '0')}.jpg';
+}
+
 class _MyHomePageState extends State<MyHomePage> {
   String _videoPath = '';
   String _customPath = '';
   int _intervalSeconds = 10;
 
+  // -y only overwrites frames this run produces again, so remove every frame
+  // left by an earlier run with the same prefix before extracting.
+  Future<void> _deleteStaleFrames(String directoryPath, String framePrefix) async {
+    final directory = Directory(directoryPath);
+    if (!await directory.exists()) {
+      return;
+    }
+    final framePattern = RegExp('^${RegExp.escape(framePrefix)}_\\d{3,}\\.jpg\$');
+    await for (final entity in directory.list()) {
+      if (entity is File &&
+          framePattern.hasMatch(entity.path.split(Platform.pathSeparator).last)) {
+        await entity.delete();
+      }
+    }
+  }
+
   Future<void> _pickVideo() async {
     // Request permission to save images and wait for the user's response
     await _requestPermission();
@@ -64,16 +99,53 @@ class _MyHomePageState extends State<MyHomePage> {
   }
 
   Future<void> _extractImagesFromVideo() async {
-    final imagePath = '$_customPath/image_%03d.jpg';
+    final framePrefix = frameFilePrefix(_videoPath);
+    final imagePath = frameOutputPattern(_customPath, framePrefix);
 
-    await FFmpegKit.execute('-i $_videoPath -vf "fps=1/$_intervalSeconds" $imagePath').then((session) async {
+    try {
+      // ffmpeg will not create the output directory itself.
+      if (_customPath.isNotEmpty) {
+        await Directory(_customPath).create(recursive: true);
+      }
+      await _deleteStaleFrames(_customPath, framePrefix);
+    } on FileSystemException catch (e) {
+      // エラーログの表示
+      if (kDebugMode) {
+        print(e);
+      }
+      return;
+    }
+
+    // Pass the arguments as a list so paths containing spaces reach ffmpeg intact.
+    await FFmpegKit.executeWithArguments([
+      // FFmpegKit keeps every log line of a session in memory; only errors are needed.
+      '-hide_banner', '-nostats', '-loglevel', 'error',
+      // Let ffmpeg pick a hardware decoder when one exists, else decode on all cores.
+      '-hwaccel', 'auto',
+      '-threads', '0',
+      '-i', _videoPath,
+      // Only the primary video stream is needed; skip decoding audio and subtitles.
+      '-an', '-sn', '-map', '0:v:0',
+      '-vf', 'fps=1/$_intervalSeconds',
+      '-q:v', '5',
+      '-y',
+      imagePath,
+    ]).then((session) async {
       final returnCode = await session.getReturnCode();
       if (returnCode!.isValueSuccess()) {
-        for (int i = 0; i < 10; i++) {
-          final imageFile = File('$_customPath/image_${i.toString().padLeft(3, '0')}.jpg');
-          if (imageFile.existsSync()) {
-            await GallerySaver.saveImage(imageFile.path);
+        // The image2 muxer numbers frames from 1; collect every frame it wrote.
+        for (int i = 1;; i++) {
+          final imageFile = File(frameImagePath(_customPath, framePrefix, i));
+          if (!imageFile.existsSync()) {
+            break;
           }
+          // GallerySaver tracks a single pending save, so calls must not overlap.
+          await GallerySaver.saveImage(imageFile.path);
+        }
+      } else {
+        // エラーログの表示
+        if (kDebugMode) {
+          print(await session.getAllLogsAsString());
         }
       }
     });
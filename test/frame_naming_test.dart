@@ -0,0 +1,49 @@
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+
+import 'package:video_frame_capture/main.dart';
+
+void main() {
+  final sep = Platform.pathSeparator;
+
+  group('frameFilePrefix', () {
+    test('strips the directory and extension', () {
+      expect(frameFilePrefix('${sep}videos${sep}clip.mp4'), 'clip');
+    });
+
+    test('keeps names without an extension', () {
+      expect(frameFilePrefix('${sep}videos${sep}clip'), 'clip');
+      expect(frameFilePrefix('${sep}videos$sep.hidden'), '.hidden');
+    });
+
+    test('only strips the last extension', () {
+      expect(frameFilePrefix('${sep}videos${sep}my.trip.2023.mp4'), 'my.trip.2023');
+    });
+
+    test('keeps a literal %', () {
+      expect(frameFilePrefix('${sep}videos${sep}clip%20final.mp4'), 'clip%20final');
+    });
+  });
+
+  group('frameOutputPattern', () {
+    test('appends the frame sequence to the prefix', () {
+      expect(frameOutputPattern('/out', 'clip'), '/out/clip_%03d.jpg');
+    });
+
+    test('escapes % in the prefix', () {
+      expect(frameOutputPattern('/out', 'clip%20final'), '/out/clip%%20final_%03d.jpg');
+    });
+  });
+
+  group('frameImagePath', () {
+    test('matches the file ffmpeg writes for the pattern', () {
+      expect(frameImagePath('/out', 'clip', 1), '/out/clip_001.jpg');
+      expect(frameImagePath('/out', 'clip', 1234), '/out/clip_1234.jpg');
+    });
+
+    test('keeps a literal % in the prefix', () {
+      expect(frameImagePath('/out', 'clip%20final', 7), '/out/clip%20final_007.jpg');
+    });
+  });
+}